@@ -6,18 +6,107 @@ This MCP server provides basic arithmetic operations for AI agents, allowing the
 - Perform subtraction of two numbers  
 - Perform multiplication of two numbers
 - Perform division of two numbers (with error handling for division by zero)
+- Perform a whole batch of the above operations in a single call
 
 The server follows the same patterns as the note-taking and weather servers.
 """
 
+from functools import lru_cache, wraps
+from typing import Callable, Final
+
 from mcp.server.fastmcp import FastMCP
 
 # Create the MCP server instance with a descriptive name
 mcp = FastMCP("Calculator Server")
 
+# Success response templates. The tools copy these and fill in the per-call
+# values, which is cheaper than building the full dict literal every time.
+_ADD_OK: Final[dict[str, str | float | None]] = {
+    "operation": "addition",
+    "operand_1": None,
+    "operand_2": None,
+    "result": None,
+    "expression": None
+}
+_SUBTRACT_OK: Final[dict[str, str | float | None]] = {
+    "operation": "subtraction",
+    "operand_1": None,
+    "operand_2": None,
+    "result": None,
+    "expression": None
+}
+_MULTIPLY_OK: Final[dict[str, str | float | None]] = {
+    "operation": "multiplication",
+    "operand_1": None,
+    "operand_2": None,
+    "result": None,
+    "expression": None
+}
+_DIVIDE_OK: Final[dict[str, str | float | None]] = {
+    "operation": "division",
+    "operand_1": None,
+    "operand_2": None,
+    "result": None,
+    "expression": None
+}
+
+# Maximum number of distinct operand pairs remembered per operation
+CACHE_SIZE = 4096
+
+
+def _memoized(func: Callable[[float, float], float]) -> Callable[[float, float], float]:
+    """
+    Wrap an arithmetic kernel in a bounded LRU cache.
+    
+    0.0 and -0.0 compare and hash equal, so they would share a cache entry
+    and a result cached for one would be returned for the other. Calls with
+    a zero operand therefore skip the cache; they are trivial to compute.
+    """
+    cached = lru_cache(maxsize=CACHE_SIZE, typed=True)(func)
+
+    @wraps(func)
+    def wrapper(a: float, b: float) -> float:
+        if a and b:
+            return cached(a, b)
+        return func(a, b)
+
+    return wrapper
+
+
+# Pure arithmetic kernels shared by the tools. Agents often repeat the same
+# sub-calculation, so results are memoized in bounded LRU caches. typed=True
+# keeps int and float operands apart so results keep the caller's type.
+@_memoized
+def _add(a: float, b: float) -> float:
+    return a + b
+
+
+@_memoized
+def _subtract(a: float, b: float) -> float:
+    return a - b
+
+
+@_memoized
+def _multiply(a: float, b: float) -> float:
+    return a * b
+
+
+@_memoized
+def _divide(a: float, b: float) -> float:
+    return a / b
+
+
+# Operation codes accepted by calc_batch, mapped to their implementations
+_BATCH_OPERATIONS: Final[dict[str, Callable[[float, float], float]]] = {
+    "add": _add,
+    "sub": _subtract,
+    "mul": _multiply,
+    "div": _divide
+}
+
 
 @mcp.tool()
-def add(a: float, b: float) -> dict[str, str | float]:
+async def add(a: float, b: float) -> dict[str, str | float]:
     """
     Add two numbers together.
     
@@ -29,14 +118,13 @@ def add(a: float, b: float) -> dict[str, str | float]:
         dict: Dictionary containing the operation, operands, and result
     """
     try:
-        result = a + b
-        return {
-            "operation": "addition",
-            "operand_1": a,
-            "operand_2": b,
-            "result": result,
-            "expression": f"{a} + {b} = {result}"
-        }
+        result = _add(a, b)
+        response = _ADD_OK.copy()
+        response["operand_1"] = a
+        response["operand_2"] = b
+        response["result"] = result
+        response["expression"] = f"{a} + {b} = {result}"
+        return response
     except Exception as e:
         return {
             "operation": "addition",
@@ -48,7 +136,7 @@ def add(a: float, b: float) -> dict[str, str | float]:
 
 
 @mcp.tool()
-def subtract(a: float, b: float) -> dict[str, str | float]:
+async def subtract(a: float, b: float) -> dict[str, str | float]:
     """
     Subtract the second number from the first number.
     
@@ -60,14 +148,13 @@ def subtract(a: float, b: float) -> dict[str, str | float]:
         dict: Dictionary containing the operation, operands, and result
     """
     try:
-        result = a - b
-        return {
-            "operation": "subtraction",
-            "operand_1": a,
-            "operand_2": b,
-            "result": result,
-            "expression": f"{a} - {b} = {result}"
-        }
+        result = _subtract(a, b)
+        response = _SUBTRACT_OK.copy()
+        response["operand_1"] = a
+        response["operand_2"] = b
+        response["result"] = result
+        response["expression"] = f"{a} - {b} = {result}"
+        return response
     except Exception as e:
         return {
             "operation": "subtraction",
@@ -79,7 +166,7 @@ def subtract(a: float, b: float) -> dict[str, str | float]:
 
 
 @mcp.tool()
-def multiply(a: float, b: float) -> dict[str, str | float]:
+async def multiply(a: float, b: float) -> dict[str, str | float]:
     """
     Multiply two numbers together.
     
@@ -91,14 +178,13 @@ def multiply(a: float, b: float) -> dict[str, str | float]:
         dict: Dictionary containing the operation, operands, and result
     """
     try:
-        result = a * b
-        return {
-            "operation": "multiplication",
-            "operand_1": a,
-            "operand_2": b,
-            "result": result,
-            "expression": f"{a} × {b} = {result}"
-        }
+        result = _multiply(a, b)
+        response = _MULTIPLY_OK.copy()
+        response["operand_1"] = a
+        response["operand_2"] = b
+        response["result"] = result
+        response["expression"] = f"{a} × {b} = {result}"
+        return response
     except Exception as e:
         return {
             "operation": "multiplication",
@@ -110,7 +196,7 @@ def multiply(a: float, b: float) -> dict[str, str | float]:
 
 
 @mcp.tool()
-def divide(a: float, b: float) -> dict[str, str | float]:
+async def divide(a: float, b: float) -> dict[str, str | float]:
     """
     Divide the first number by the second number.
     
@@ -132,14 +218,13 @@ def divide(a: float, b: float) -> dict[str, str | float]:
                 "result": "undefined"
             }
         
-        result = a / b
-        return {
-            "operation": "division",
-            "operand_1": a,
-            "operand_2": b,
-            "result": result,
-            "expression": f"{a} ÷ {b} = {result}"
-        }
+        result = _divide(a, b)
+        response = _DIVIDE_OK.copy()
+        response["operand_1"] = a
+        response["operand_2"] = b
+        response["result"] = result
+        response["expression"] = f"{a} ÷ {b} = {result}"
+        return response
     except Exception as e:
         return {
             "operation": "division",
@@ -150,18 +235,48 @@ def divide(a: float, b: float) -> dict[str, str | float]:
         }
 
 
-@mcp.resource("calculator://operations")
-def get_available_operations() -> str:
+@mcp.tool()
+async def calc_batch(ops: list[tuple[str, float, float]]) -> dict[str, str | int | list]:
     """
-    Get information about all available calculator operations.
+    Perform many arithmetic operations in a single call.
     
-    This resource provides documentation about the calculator's capabilities,
-    which can be useful for AI agents to understand what operations are available.
+    Sending independent calculations together avoids a separate tool
+    round-trip for each one.
     
+    Args:
+        ops (list): (operation, a, b) entries, where operation is one of
+                    "add", "sub", "mul" or "div"
+        
     Returns:
-        str: Documentation of available operations
+        dict: Dictionary containing one result per entry (None where the
+              operation failed) and the error messages for failed entries
     """
-    operations_info = """
+    results: list[float | None] = []
+    errors: list[str] = []
+    
+    for index, (op, a, b) in enumerate(ops):
+        func = _BATCH_OPERATIONS.get(op)
+        if func is None:
+            results.append(None)
+            errors.append(f"Operation {index}: unknown operation '{op}'")
+            continue
+        
+        try:
+            results.append(func(a, b))
+        except ZeroDivisionError:
+            results.append(None)
+            errors.append(f"Operation {index}: Division by zero is not allowed")
+    
+    return {
+        "operation": "batch",
+        "count": len(ops),
+        "results": results,
+        "errors": errors
+    }
+
+
+# Built once at import time; the operations list never changes at runtime
+_OPERATIONS_INFO: Final[str] = """
     CALCULATOR OPERATIONS AVAILABLE:
 
     1. ADDITION (add)
@@ -185,24 +300,34 @@ def get_available_operations() -> str:
        - Example: divide(15, 3) = 5
        - Note: Division by zero returns an error
 
+    5. BATCH (calc_batch)
+       - Performs many operations in one call
+       - Usage: calc_batch([(op, a, b), ...]) with op one of "add", "sub", "mul", "div"
+       - Example: calc_batch([("add", 1, 2), ("div", 9, 3)]) returns
+         {"operation": "batch", "count": 2, "results": [3.0, 3.0], "errors": []}
+       - Note: "results" has one entry per operation, in order; a failed
+         operation yields null there and its message is listed under "errors"
+
     All operations accept floating-point numbers and return detailed result objects.
     """
-    
-    return operations_info
 
 
-@mcp.prompt("calculate-expression")
-def calculation_prompt() -> str:
+@mcp.resource("calculator://operations")
+def get_available_operations() -> str:
     """
-    Provide a prompt template for performing calculations.
+    Get information about all available calculator operations.
     
-    This prompt helps AI agents structure their approach to mathematical
-    problems and provides guidance on using the calculator tools effectively.
+    This resource provides documentation about the calculator's capabilities,
+    which can be useful for AI agents to understand what operations are available.
     
     Returns:
-        str: A prompt template for calculation assistance
+        str: Documentation of available operations
     """
-    prompt_template = """
+    return _OPERATIONS_INFO
+
+
+# Static prompt text shared by every calculate-expression request
+_CALCULATION_PROMPT: Final[str] = """
     You are a mathematical calculation assistant with access to basic arithmetic operations.
 
     AVAILABLE OPERATIONS:
@@ -210,6 +335,7 @@ def calculation_prompt() -> str:
     - subtract(a, b): Subtraction  
     - multiply(a, b): Multiplication
     - divide(a, b): Division
+    - calc_batch([(op, a, b), ...]): Many operations at once ("add", "sub", "mul", "div")
 
     CALCULATION GUIDELINES:
     1. Break down complex expressions into individual operations
@@ -217,6 +343,7 @@ def calculation_prompt() -> str:
     3. Use parentheses to clarify operation precedence
     4. Handle division by zero gracefully
     5. Provide clear explanations of each calculation step
+    6. Use calc_batch for independent operations instead of one call per operation
 
     RESPONSE FORMAT:
     - Show the mathematical expression
@@ -226,8 +353,20 @@ def calculation_prompt() -> str:
 
     Please help the user with their calculation needs using the available tools.
     """
+
+
+@mcp.prompt("calculate-expression")
+def calculation_prompt() -> str:
+    """
+    Provide a prompt template for performing calculations.
+    
+    This prompt helps AI agents structure their approach to mathematical
+    problems and provides guidance on using the calculator tools effectively.
     
-    return prompt_template
+    Returns:
+        str: A prompt template for calculation assistance
+    """
+    return _CALCULATION_PROMPT
 
 
 def main():
@@ -239,7 +378,7 @@ def main():
     resources, and prompts.
     """
     print("🧮 Starting Calculator MCP Server...")
-    print("🔧 Available tools: add, subtract, multiply, divide")
+    print("🔧 Available tools: add, subtract, multiply, divide, calc_batch")
     print("📊 Available resources: get_available_operations")  
     print("📋 Available prompts: calculation_prompt")
     print("🚀 Server ready for AI agent connections!")
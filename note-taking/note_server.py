@@ -11,7 +11,10 @@ Based on the tutorial from: https://www.youtube.com/watch?v=-8k9lGpGQ6g
 Source code reference: https://github.com/techwithtim/PythonMCPServer
 """
 
+import atexit
 import os
+from typing import Final, Optional, TextIO, Tuple
+
 from mcp.server.fastmcp import FastMCP
 
 # Create the MCP server instance with a descriptive name
@@ -19,6 +22,24 @@ mcp = FastMCP("AI Sticky Notes")
 
 # Configuration - Define the file where notes will be stored
 NOTES_FILE = os.path.join(os.path.dirname(__file__), "notes.txt")
+NOTES_ENCODING = "utf-8"
+
+# Set once the notes file is known to exist, so later calls skip the check
+_file_ready = False
+
+# Fingerprint of the notes file: (mtime_ns, size, device, inode)
+_Signature = Tuple[int, int, int, int]
+
+# Append handle shared by every add_note call (opened on first use), and the
+# (device, inode) of the file it was opened on
+_notes_fp: Optional[TextIO] = None
+_notes_fp_id: Optional[Tuple[int, int]] = None
+
+# In-memory copy of the notes file's bytes. add_note appends to both the file
+# (the source of truth) and the mirror; the mirror is reloaded whenever the
+# file's signature shows it was changed by someone else.
+_notes_mirror: Optional[bytearray] = None
+_mirror_key: Optional[_Signature] = None
 
 
 def ensure_file() -> None:
@@ -28,16 +49,162 @@ def ensure_file() -> None:
     This function checks if the notes.txt file exists, and if not,
     creates it with an empty state. This prevents file not found errors
     when trying to read or append to the file.
+    
+    The outcome is remembered, so only the first call touches the filesystem.
     """
+    global _file_ready
+
+    if _file_ready:
+        return
+
     if not os.path.exists(NOTES_FILE):
         # Create the file in write mode (this will create a new file)
         with open(NOTES_FILE, "w") as f:
             # Write an empty string to initialize the file
             f.write("")
 
+    _file_ready = True
+
+
+def _notes_writer(signature: _Signature) -> TextIO:
+    """
+    Return the shared append handle for the notes file, opening it if needed.
+
+    The handle is line buffered, so each note reaches the OS as soon as its
+    trailing newline is written and is immediately visible to readers.
+
+    Args:
+        signature: The file's current signature from _ready_signature()
+    """
+    global _notes_fp, _notes_fp_id
+
+    if _notes_fp is not None and signature[2:] != _notes_fp_id:
+        # The file was replaced (e.g. an atomic-rename save or a git checkout);
+        # the handle still points at the old copy, so reopen by name
+        _forget_file()
+
+    if _notes_fp is None:
+        _notes_fp = open(NOTES_FILE, "a", buffering=1, encoding=NOTES_ENCODING)
+        atexit.register(_notes_fp.close)
+        stat = os.fstat(_notes_fp.fileno())
+        _notes_fp_id = (stat.st_dev, stat.st_ino)
+
+    return _notes_fp
+
+
+def _notes_signature() -> _Signature:
+    """
+    Return a cheap fingerprint of the notes file for cache validation.
+
+    The size is included alongside the nanosecond mtime because appends
+    within the filesystem's timestamp granularity would otherwise look
+    unchanged. The device and inode identify which file is at the path, so
+    a replaced file is detected even if its mtime and size happen to match.
+    """
+    stat = os.stat(NOTES_FILE)
+    return stat.st_mtime_ns, stat.st_size, stat.st_dev, stat.st_ino
+
+
+def _forget_file() -> None:
+    """
+    Drop everything cached about the notes file after it has disappeared
+    or been replaced.
+
+    Closes the shared append handle, which would otherwise keep writing to
+    the old file, so the next ensure_file() starts from scratch.
+    """
+    global _file_ready, _notes_fp, _notes_fp_id, _notes_mirror, _mirror_key
+
+    if _notes_fp is not None:
+        atexit.unregister(_notes_fp.close)
+        _notes_fp.close()
+        _notes_fp = _notes_fp_id = None
+
+    _file_ready = False
+    _notes_mirror = _mirror_key = None
+
+
+def _ready_signature() -> _Signature:
+    """
+    Return the notes file's signature, recreating the file if it was deleted.
+
+    This is how every handler reaches the notes file, so it is also where
+    ensure_file() runs.
+
+    Returns:
+        tuple: (mtime_ns, size, device, inode) as from _notes_signature()
+    """
+    ensure_file()
+    try:
+        return _notes_signature()
+    except FileNotFoundError:
+        # Deleted while the server was running (e.g. notes cleared by hand)
+        _forget_file()
+        ensure_file()
+        return _notes_signature()
+
+
+def _load_mirror(signature: _Signature) -> bytearray:
+    """
+    Return the in-memory copy of the notes file, re-reading it if stale.
+
+    Args:
+        signature: The file's current signature from _notes_signature()
+    """
+    global _notes_mirror, _mirror_key
+
+    if _notes_mirror is None or signature != _mirror_key:
+        mirror = bytearray(signature[1])
+        with open(NOTES_FILE, "rb") as f:
+            # Read straight into the preallocated buffer (no intermediate bytes)
+            size = f.readinto(mirror)
+        del mirror[size:]
+        _notes_mirror, _mirror_key = mirror, signature
+
+    return _notes_mirror
+
+
+def _append_to_mirror(data: bytes, previous: _Signature) -> None:
+    """
+    Mirror an append that has just been written to the notes file.
+
+    Args:
+        data: The bytes that were appended
+        previous: The file's signature from before the append
+    """
+    global _notes_mirror, _mirror_key
+
+    if _notes_mirror is None or previous != _mirror_key:
+        return
+
+    _notes_mirror += data
+    signature = _notes_signature()
+    if signature[1] == len(_notes_mirror):
+        _mirror_key = signature
+    else:
+        # Something else touched the file meanwhile; reload on next access
+        _notes_mirror = None
+
+
+def _last_line(data: bytearray) -> str:
+    """
+    Return the last line of the notes without scanning the whole buffer.
+
+    Returns:
+        str: The final line (without its line break), or "" when empty
+    """
+    end = len(data)
+
+    # Ignore the line break that terminates the last note
+    if end and data[end - 1] == ord("\n"):
+        end -= 1
+
+    start = data.rfind(b"\n", 0, end) + 1
+    return data[start:end].decode(NOTES_ENCODING)
+
 
 @mcp.tool()
-def add_note(message: str) -> str:
+async def add_note(message: str) -> str:
     """
     Append a new note to the sticky notes file.
     
@@ -50,20 +217,22 @@ def add_note(message: str) -> str:
     Returns:
         str: Confirmation message indicating the note was saved
     """
-    # Ensure the notes file exists before writing to it
-    ensure_file()
+    note = message + "\n"
+    previous = _ready_signature()
+    
+    # Write the message followed by a newline character through the shared
+    # append-mode handle instead of reopening the file for every note
+    _notes_writer(previous).write(note)
     
-    # Open the file in append mode to add content without overwriting
-    with open(NOTES_FILE, "a") as f:
-        # Write the message followed by a newline character
-        f.write(message + "\n")
+    # Keep the in-memory copy in step so readers don't go back to disk
+    _append_to_mirror(note.encode(NOTES_ENCODING), previous)
     
     # Return a confirmation message to the AI agent
     return "Note saved!"
 
 
 @mcp.tool()
-def read_notes() -> str:
+async def read_notes() -> str:
     """
     Read and return all notes from the sticky notes file.
     
@@ -73,14 +242,9 @@ def read_notes() -> str:
     Returns:
         str: All notes content or a message if no notes exist
     """
-    # Ensure the file exists before trying to read it
-    ensure_file()
-    
     try:
-        # Open the file in read mode
-        with open(NOTES_FILE, "r") as f:
-            # Read all content from the file
-            content = f.read()
+        # Decode the in-memory copy of the file (the only copy kept resident)
+        content = _load_mirror(_ready_signature()).decode(NOTES_ENCODING)
         
         # Check if the file is empty or contains only whitespace
         if not content.strip():
@@ -94,7 +258,7 @@ def read_notes() -> str:
 
 
 @mcp.resource("notes://latest")
-def get_latest_note() -> str:
+async def get_latest_note() -> str:
     """
     Get the most recent note from the sticky notes file.
     
@@ -108,20 +272,10 @@ def get_latest_note() -> str:
     Returns:
         str: The latest note content or a message if no notes exist
     """
-    # Ensure the file exists before reading
-    ensure_file()
-    
     try:
-        # Open and read the file
-        with open(NOTES_FILE, "r") as f:
-            lines = f.readlines()
-        
-        # Check if there are any notes
-        if not lines:
-            return "No notes available."
-        
-        # Get the last line (most recent note) and strip whitespace
-        latest_note = lines[-1].strip()
+        # Scan back from the end of the in-memory copy for the last line
+        # (most recent note) and strip whitespace
+        latest_note = _last_line(_load_mirror(_ready_signature())).strip()
         
         # Return the latest note or a message if it's empty
         return latest_note if latest_note else "No notes available."
@@ -131,8 +285,26 @@ def get_latest_note() -> str:
         return f"Error retrieving latest note: {str(e)}"
 
 
+# Only the notes change between requests, so the surrounding text is built once
+_NOTE_SUMMARY_TEMPLATE: Final[str] = """
+        Please analyze and summarize the following notes:
+
+        NOTES CONTENT:
+        {notes}
+
+        SUMMARIZATION INSTRUCTIONS:
+        1. Provide a concise overview of the main topics covered
+        2. Identify any recurring themes or patterns
+        3. Highlight the most important or actionable items
+        4. Organize the summary in a clear, structured format
+        5. If there are many notes, group related topics together
+
+        Please create a well-organized summary that captures the key information from these notes.
+        """
+
+
 @mcp.prompt("note-summary")
-def note_summary_prompt() -> str:
+async def note_summary_prompt() -> str:
     """
     Provide a reusable prompt template for summarizing notes.
     
@@ -146,26 +318,9 @@ def note_summary_prompt() -> str:
         str: A prompt template for note summarization
     """
     # Read the current notes to include in the prompt
-    current_notes = read_notes()
-    
-    # Create a comprehensive prompt template
-    prompt_template = f"""
-        Please analyze and summarize the following notes:
-
-        NOTES CONTENT:
-        {current_notes}
-
-        SUMMARIZATION INSTRUCTIONS:
-        1. Provide a concise overview of the main topics covered
-        2. Identify any recurring themes or patterns
-        3. Highlight the most important or actionable items
-        4. Organize the summary in a clear, structured format
-        5. If there are many notes, group related topics together
-
-        Please create a well-organized summary that captures the key information from these notes.
-        """
+    current_notes = await read_notes()
     
-    return prompt_template
+    return _NOTE_SUMMARY_TEMPLATE.format(notes=current_notes)
 
 
 def main():
@@ -12,6 +12,12 @@ This MCP server provides smart bulb control capabilities for AI agents, allowing
 The server uses the WizBulbController to communicate with Philips WiZ bulbs.
 """
 
+import asyncio
+import atexit
+import time
+from dataclasses import dataclass, fields
+from typing import Final, Optional, Tuple
+
 from mcp.server.fastmcp import FastMCP
 from wiz_bulb_controller import WizBulbController
 
@@ -21,20 +27,221 @@ mcp = FastMCP("Smart Bulb Server")
 # Configure the bulb IP address
 BULB_IP = "192.168.1.8"
 
-# Initialize the bulb controller
+# Pilot changes requested within this window (seconds) are sent as one setPilot.
+# Only concurrent tool calls merge; a lone call still waits out the window.
+PILOT_COALESCE_WINDOW = 0.02
+
+# How long (seconds) a known online/offline state is trusted before re-probing
+ONLINE_CACHE_TTL = 2.0
+
+# Initialize the bulb controller (its UDP socket is reused for every command)
 bulb = WizBulbController(BULB_IP)
+atexit.register(bulb.close)
+
+# Scene names for reference, indexed by scene ID - 1
+_SCENE_NAMES: Final[Tuple[str, ...]] = (
+    "Ocean", "Romance", "Sunset", "Party", "Fireplace",
+    "Cozy", "Forest", "Pastel Colors", "Wake up", "Bedtime",
+    "Warm White", "Daylight", "Cool white", "Night light",
+    "Focus", "Relax", "True colors", "TV time", "Plantgrowth",
+    "Spring", "Summer", "Fall", "Deepdive", "Jungle",
+    "Mojito", "Club", "Christmas", "Halloween", "Candlelight",
+    "Golden white", "Pulse", "Steampunk"
+)
+
+# Response messages. Success templates are only formatted when the command
+# succeeded; failure messages are constants so the failure path formats nothing.
+_MSG_BRIGHTNESS_OK: Final[str] = "Brightness set to {brightness}%"
+_MSG_BRIGHTNESS_FAILED: Final[str] = "Failed to set brightness"
+_MSG_RGB_OK: Final[str] = "Color set to RGB({r}, {g}, {b}) at {brightness}% brightness"
+_MSG_RGB_FAILED: Final[str] = "Failed to set RGB color"
+_MSG_TEMPERATURE_OK: Final[str] = "Color temperature set to {temperature}K at {brightness}% brightness"
+_MSG_TEMPERATURE_FAILED: Final[str] = "Failed to set color temperature"
+_MSG_SCENE_OK: Final[str] = "Scene set to '{scene_name}' (ID: {scene_id})"
+_MSG_SCENE_FAILED: Final[str] = "Failed to set scene"
+_MSG_ONLINE: Final[str] = f"Bulb at {BULB_IP} is online"
+_MSG_OFFLINE: Final[str] = f"Bulb at {BULB_IP} is offline"
+
+# Units of the numeric fields reported by get_bulb_status
+_STATUS_UNITS: Final[dict] = {"brightness": "%", "color_temperature": "K"}
+
+
+@dataclass
+class _PendingPilot:
+    """setPilot parameters collected since the last flush (None means not set)."""
+
+    r: Optional[int] = None
+    g: Optional[int] = None
+    b: Optional[int] = None
+    temp: Optional[int] = None
+    dimming: Optional[int] = None
+    sceneId: Optional[int] = None
+    state: Optional[bool] = None
+
+    @staticmethod
+    def _cleared_by(params: dict) -> Tuple[str, ...]:
+        """Return the fields a new color mode in params switches off."""
+        # RGB, white temperature and scenes are mutually exclusive on WiZ bulbs
+        if "r" in params:
+            return ("temp", "sceneId")
+        if "temp" in params:
+            return ("r", "g", "b", "sceneId")
+        if "sceneId" in params:
+            return ("r", "g", "b", "temp")
+        return ()
+
+    def conflicts(self, params: dict) -> bool:
+        """Tell whether merging params would clear or overwrite a pending change."""
+        if any(getattr(self, name) is not None for name in self._cleared_by(params)):
+            return True
+        for name, value in params.items():
+            current = getattr(self, name)
+            if current is not None and current != value:
+                return True
+        return False
+
+    def update(self, **params) -> None:
+        """Merge new parameters, letting the latest color mode win."""
+        for name in self._cleared_by(params):
+            setattr(self, name, None)
+
+        for name, value in params.items():
+            setattr(self, name, value)
+
+    def params(self) -> dict:
+        """Return only the parameters that have been set."""
+        return {
+            field.name: getattr(self, field.name)
+            for field in fields(self)
+            if getattr(self, field.name) is not None
+        }
+
+
+# Coalescing state: the pending pilot, the future its callers wait on and the
+# timer that will flush it. The lock keeps flushes ordered on the wire.
+_pilot_lock = asyncio.Lock()
+_pending_pilot = _PendingPilot()
+_pilot_result: Optional[asyncio.Future] = None
+_flush_handle: Optional[asyncio.TimerHandle] = None
+
+# (monotonic timestamp, online) from the last probe or bulb reply
+_online_cache: Optional[Tuple[float, bool]] = None
+
+
+def _record_online(online: bool) -> None:
+    """Remember the bulb's reachability as observed just now."""
+    global _online_cache
+    _online_cache = (time.monotonic(), online)
+
+
+def _fresh_online_state() -> Optional[bool]:
+    """Return the cached reachability if it is younger than ONLINE_CACHE_TTL."""
+    if _online_cache is not None and time.monotonic() - _online_cache[0] < ONLINE_CACHE_TTL:
+        return _online_cache[1]
+    return None
+
+
+async def _cached_is_online() -> bool:
+    """Check whether the bulb is online, probing it only when the cache is stale."""
+    online = _fresh_online_state()
+    if online is None:
+        online = await asyncio.to_thread(bulb.is_online)
+        _record_online(online)
+    return online
+
+
+def _take_pending() -> Tuple[_PendingPilot, Optional[asyncio.Future]]:
+    """Detach the pending pilot and its future so new calls start a fresh batch."""
+    global _pending_pilot, _pilot_result, _flush_handle
+
+    if _flush_handle is not None:
+        _flush_handle.cancel()
+        _flush_handle = None
+
+    pending, result = _pending_pilot, _pilot_result
+    _pending_pilot, _pilot_result = _PendingPilot(), None
+    return pending, result
+
+
+async def _send_pending(pending: _PendingPilot, result: Optional[asyncio.Future]) -> None:
+    """Send a detached pilot as a single setPilot request and resolve its waiters."""
+    # Taking the lock even with nothing pending waits out any in-flight flush.
+    # asyncio.Lock is FIFO, so batches reach the bulb in the order they were taken.
+    async with _pilot_lock:
+        if result is None:
+            return
+        try:
+            success = await asyncio.to_thread(bulb.set_pilot, pending.params())
+        except Exception as e:
+            result.set_exception(e)
+        else:
+            # A successful reply proves the bulb is reachable; no probe needed
+            if success:
+                _record_online(True)
+            result.set_result(success)
+
+
+async def _flush() -> None:
+    """Send the pending pilot as a single setPilot request and resolve its waiters."""
+    await _send_pending(*_take_pending())
+
+
+async def flush_now() -> None:
+    """Send any pending pilot change immediately and wait for the bulb's reply."""
+    await _flush()
+
+
+async def _queue_pilot(**params) -> bool:
+    """
+    Queue pilot parameters and wait for the coalesced setPilot to complete.
+
+    Every call made within PILOT_COALESCE_WINDOW of the first one shares a
+    single UDP round-trip and receives the same success flag. A call that
+    would clear or overwrite a pending change (another color mode, a different
+    state or value) first sends the pending batch on its own, so no caller is
+    told a change succeeded when it never reached the bulb.
+
+    Agents usually call one tool at a time and wait for the reply, so in the
+    common case nothing merges and each change pays the window as extra latency.
+    """
+    global _pilot_result, _flush_handle
+
+    if _pilot_result is not None and _pending_pilot.conflicts(params):
+        asyncio.ensure_future(_send_pending(*_take_pending()))
+
+    _pending_pilot.update(**params)
+    if _pilot_result is None:
+        loop = asyncio.get_running_loop()
+        _pilot_result = loop.create_future()
+        _flush_handle = loop.call_later(
+            PILOT_COALESCE_WINDOW, lambda: asyncio.ensure_future(_flush())
+        )
+
+    return await asyncio.shield(_pilot_result)
 
 
 @mcp.tool()
-def get_bulb_status() -> dict:
+async def get_bulb_status() -> dict:
     """
     Get the current status of the smart bulb.
     
+    Numeric properties are reported as plain numbers; their units are given
+    in the "units" entry (brightness in %, color temperature in Kelvin).
+    
     Returns:
         dict: Dictionary containing the bulb's current state and properties
     """
     try:
-        status = bulb.get_status()
+        # Make sure queued changes have reached the bulb before reading it back
+        await flush_now()
+        
+        # Skip the UDP timeout when the bulb was just seen offline
+        if _fresh_online_state() is False:
+            status = None
+        else:
+            status = await asyncio.to_thread(bulb.get_status)
+            _record_online(status is not None)
+        
         if status is None:
             return {
                 "error": f"Failed to get status from bulb at {BULB_IP}",
@@ -43,22 +250,23 @@ def get_bulb_status() -> dict:
             }
         
         # Extract useful information from the status
+        pilot_data = status.get("result", {})
         result = {
             "bulb_ip": BULB_IP,
             "status": "online",
-            "state": "on" if status.get("result", {}).get("state", False) else "off"
+            "state": "on" if pilot_data.get("state", False) else "off",
+            "units": _STATUS_UNITS
         }
         
         # Add brightness if available
-        if "dimming" in status.get("result", {}):
-            result["brightness"] = f"{status['result']['dimming']}%"
+        if "dimming" in pilot_data:
+            result["brightness"] = pilot_data["dimming"]
         
         # Add color information if available
-        pilot_data = status.get("result", {})
         if "r" in pilot_data and "g" in pilot_data and "b" in pilot_data:
-            result["color"] = f"RGB({pilot_data['r']}, {pilot_data['g']}, {pilot_data['b']})"
+            result["color"] = {"r": pilot_data["r"], "g": pilot_data["g"], "b": pilot_data["b"]}
         elif "temp" in pilot_data:
-            result["color_temperature"] = f"{pilot_data['temp']}K"
+            result["color_temperature"] = pilot_data["temp"]
         
         # Add scene if available
         if "sceneId" in pilot_data:
@@ -75,7 +283,7 @@ def get_bulb_status() -> dict:
 
 
 @mcp.tool()
-def turn_bulb_on() -> dict:
+async def turn_bulb_on() -> dict:
     """
     Turn the smart bulb on.
     
@@ -83,7 +291,7 @@ def turn_bulb_on() -> dict:
         dict: Dictionary containing the operation result
     """
     try:
-        success = bulb.turn_on()
+        success = await _queue_pilot(state=True)
         return {
             "operation": "turn_on",
             "bulb_ip": BULB_IP,
@@ -100,7 +308,7 @@ def turn_bulb_on() -> dict:
 
 
 @mcp.tool()
-def turn_bulb_off() -> dict:
+async def turn_bulb_off() -> dict:
     """
     Turn the smart bulb off.
     
@@ -108,7 +316,7 @@ def turn_bulb_off() -> dict:
         dict: Dictionary containing the operation result
     """
     try:
-        success = bulb.turn_off()
+        success = await _queue_pilot(state=False)
         return {
             "operation": "turn_off",
             "bulb_ip": BULB_IP,
@@ -125,7 +333,7 @@ def turn_bulb_off() -> dict:
 
 
 @mcp.tool()
-def set_bulb_brightness(brightness: int) -> dict:
+async def set_bulb_brightness(brightness: int) -> dict:
     """
     Set the brightness level of the smart bulb.
     
@@ -145,13 +353,13 @@ def set_bulb_brightness(brightness: int) -> dict:
                 "requested_brightness": brightness
             }
         
-        success = bulb.set_brightness(brightness)
+        success = await _queue_pilot(state=True, dimming=brightness)
         return {
             "operation": "set_brightness",
             "bulb_ip": BULB_IP,
             "success": success,
             "brightness": brightness,
-            "message": f"Brightness set to {brightness}%" if success else f"Failed to set brightness to {brightness}%"
+            "message": _MSG_BRIGHTNESS_OK.format(brightness=brightness) if success else _MSG_BRIGHTNESS_FAILED
         }
     except Exception as e:
         return {
@@ -164,7 +372,7 @@ def set_bulb_brightness(brightness: int) -> dict:
 
 
 @mcp.tool()
-def set_bulb_rgb_color(r: int, g: int, b: int, brightness: int = 100) -> dict:
+async def set_bulb_rgb_color(r: int, g: int, b: int, brightness: int = 100) -> dict:
     """
     Set the RGB color of the smart bulb.
     
@@ -178,7 +386,8 @@ def set_bulb_rgb_color(r: int, g: int, b: int, brightness: int = 100) -> dict:
         dict: Dictionary containing the operation result
     """
     try:
-        if not all(0 <= val <= 255 for val in [r, g, b]):
+        # Any channel outside 0-255 (negatives included) has bits above the low byte
+        if (r | g | b) & ~0xFF:
             return {
                 "operation": "set_rgb_color",
                 "bulb_ip": BULB_IP,
@@ -196,14 +405,14 @@ def set_bulb_rgb_color(r: int, g: int, b: int, brightness: int = 100) -> dict:
                 "requested_brightness": brightness
             }
         
-        success = bulb.set_rgb_color(r, g, b, brightness)
+        success = await _queue_pilot(state=True, r=r, g=g, b=b, dimming=brightness)
         return {
             "operation": "set_rgb_color",
             "bulb_ip": BULB_IP,
             "success": success,
             "color": f"RGB({r}, {g}, {b})",
             "brightness": brightness,
-            "message": f"Color set to RGB({r}, {g}, {b}) at {brightness}% brightness" if success else "Failed to set RGB color"
+            "message": _MSG_RGB_OK.format(r=r, g=g, b=b, brightness=brightness) if success else _MSG_RGB_FAILED
         }
     except Exception as e:
         return {
@@ -217,7 +426,7 @@ def set_bulb_rgb_color(r: int, g: int, b: int, brightness: int = 100) -> dict:
 
 
 @mcp.tool()
-def set_bulb_color_temperature(temperature: int, brightness: int = 100) -> dict:
+async def set_bulb_color_temperature(temperature: int, brightness: int = 100) -> dict:
     """
     Set the color temperature of the smart bulb (warm/cool white).
     
@@ -247,14 +456,14 @@ def set_bulb_color_temperature(temperature: int, brightness: int = 100) -> dict:
                 "requested_brightness": brightness
             }
         
-        success = bulb.set_color_temperature(temperature, brightness)
+        success = await _queue_pilot(state=True, temp=temperature, dimming=brightness)
         return {
             "operation": "set_color_temperature",
             "bulb_ip": BULB_IP,
             "success": success,
             "temperature": f"{temperature}K",
             "brightness": brightness,
-            "message": f"Color temperature set to {temperature}K at {brightness}% brightness" if success else "Failed to set color temperature"
+            "message": _MSG_TEMPERATURE_OK.format(temperature=temperature, brightness=brightness) if success else _MSG_TEMPERATURE_FAILED
         }
     except Exception as e:
         return {
@@ -268,7 +477,7 @@ def set_bulb_color_temperature(temperature: int, brightness: int = 100) -> dict:
 
 
 @mcp.tool()
-def set_bulb_scene(scene_id: int) -> dict:
+async def set_bulb_scene(scene_id: int) -> dict:
     """
     Set a predefined scene on the smart bulb.
     
@@ -281,17 +490,6 @@ def set_bulb_scene(scene_id: int) -> dict:
         dict: Dictionary containing the operation result
     """
     try:
-        # Scene names for reference
-        scene_names = {
-            1: "Ocean", 2: "Romance", 3: "Sunset", 4: "Party", 5: "Fireplace",
-            6: "Cozy", 7: "Forest", 8: "Pastel Colors", 9: "Wake up", 10: "Bedtime",
-            11: "Warm White", 12: "Daylight", 13: "Cool white", 14: "Night light",
-            15: "Focus", 16: "Relax", 17: "True colors", 18: "TV time", 19: "Plantgrowth",
-            20: "Spring", 21: "Summer", 22: "Fall", 23: "Deepdive", 24: "Jungle",
-            25: "Mojito", 26: "Club", 27: "Christmas", 28: "Halloween", 29: "Candlelight",
-            30: "Golden white", 31: "Pulse", 32: "Steampunk"
-        }
-        
         if not 1 <= scene_id <= 32:
             return {
                 "operation": "set_scene",
@@ -301,8 +499,8 @@ def set_bulb_scene(scene_id: int) -> dict:
                 "requested_scene_id": scene_id
             }
         
-        success = bulb.set_scene(scene_id)
-        scene_name = scene_names.get(scene_id, f"Scene {scene_id}")
+        success = await _queue_pilot(state=True, sceneId=scene_id)
+        scene_name = _SCENE_NAMES[scene_id - 1] if 1 <= scene_id <= len(_SCENE_NAMES) else f"Scene {scene_id}"
         
         return {
             "operation": "set_scene",
@@ -310,7 +508,7 @@ def set_bulb_scene(scene_id: int) -> dict:
             "success": success,
             "scene_id": scene_id,
             "scene_name": scene_name,
-            "message": f"Scene set to '{scene_name}' (ID: {scene_id})" if success else f"Failed to set scene '{scene_name}'"
+            "message": _MSG_SCENE_OK.format(scene_name=scene_name, scene_id=scene_id) if success else _MSG_SCENE_FAILED
         }
     except Exception as e:
         return {
@@ -323,7 +521,7 @@ def set_bulb_scene(scene_id: int) -> dict:
 
 
 @mcp.tool()
-def check_bulb_connection() -> dict:
+async def check_bulb_connection() -> dict:
     """
     Check if the smart bulb is online and responding.
     
@@ -331,13 +529,13 @@ def check_bulb_connection() -> dict:
         dict: Dictionary containing the connection status
     """
     try:
-        is_online = bulb.is_online()
+        is_online = await _cached_is_online()
         return {
             "operation": "check_connection",
             "bulb_ip": BULB_IP,
             "online": is_online,
             "status": "connected" if is_online else "disconnected",
-            "message": f"Bulb at {BULB_IP} is {'online' if is_online else 'offline'}"
+            "message": _MSG_ONLINE if is_online else _MSG_OFFLINE
         }
     except Exception as e:
         return {
@@ -349,18 +547,8 @@ def check_bulb_connection() -> dict:
         }
 
 
-@mcp.resource("smartbulb://capabilities")
-def get_bulb_capabilities() -> str:
-    """
-    Get information about all available smart bulb capabilities.
-    
-    This resource provides documentation about the bulb's capabilities,
-    which can be useful for AI agents to understand what operations are available.
-    
-    Returns:
-        str: Documentation of available bulb operations
-    """
-    capabilities_info = """
+# BULB_IP is fixed for the lifetime of the server, so format it in once
+_BULB_CAPABILITIES: Final[str] = """
     SMART BULB CAPABILITIES AVAILABLE:
 
     1. POWER CONTROL
@@ -389,22 +577,24 @@ def get_bulb_capabilities() -> str:
 
     All operations return detailed status information including success/failure and error messages.
     """.format(BULB_IP=BULB_IP)
-    
-    return capabilities_info
 
 
-@mcp.prompt("control-smart-bulb")
-def bulb_control_prompt() -> str:
+@mcp.resource("smartbulb://capabilities")
+def get_bulb_capabilities() -> str:
     """
-    Provide a prompt template for controlling the smart bulb.
+    Get information about all available smart bulb capabilities.
     
-    This prompt helps AI agents structure their approach to smart bulb control
-    and provides guidance on using the bulb control tools effectively.
+    This resource provides documentation about the bulb's capabilities,
+    which can be useful for AI agents to understand what operations are available.
     
     Returns:
-        str: A prompt template for smart bulb control assistance
+        str: Documentation of available bulb operations
     """
-    prompt_template = f"""
+    return _BULB_CAPABILITIES
+
+
+# Lighting assistant prompt with the bulb IP baked in at import time
+_BULB_CONTROL_PROMPT: Final[str] = f"""
     You are a smart home lighting assistant with access to control a Philips WiZ smart bulb.
 
     CURRENT BULB CONFIGURATION:
@@ -434,8 +624,20 @@ def bulb_control_prompt() -> str:
 
     Please help the user control their smart bulb effectively and create the perfect lighting ambiance.
     """
+
+
+@mcp.prompt("control-smart-bulb")
+def bulb_control_prompt() -> str:
+    """
+    Provide a prompt template for controlling the smart bulb.
     
-    return prompt_template
+    This prompt helps AI agents structure their approach to smart bulb control
+    and provides guidance on using the bulb control tools effectively.
+    
+    Returns:
+        str: A prompt template for smart bulb control assistance
+    """
+    return _BULB_CONTROL_PROMPT
 
 
 def main():
@@ -457,7 +659,9 @@ def main():
     
     # Test bulb connection on startup
     print(f"\n🔍 Testing connection to bulb at {BULB_IP}...")
-    if bulb.is_online():
+    is_online = bulb.is_online()
+    _record_online(is_online)
+    if is_online:
         print("✅ Bulb is online and ready!")
     else:
         print("⚠️  Warning: Cannot connect to bulb. Please check:")
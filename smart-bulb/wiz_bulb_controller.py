@@ -5,14 +5,137 @@ A Python library for controlling Philips WiZ bulbs via UDP local control protoco
 """
 
 from typing import Dict, Any, Optional
+import ipaddress
+import logging
+import selectors
 import socket
 import json
+import threading
 import time
 
+log = logging.getLogger(__name__)
+
+# orjson is much faster than the stdlib json module and works on bytes
+# directly; fall back to json when it isn't installed
+try:
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+    def _json_loads(data: Any) -> Any:
+        # json.loads doesn't accept memoryviews
+        return json.loads(bytes(data))
+
+
+# Shared stand-in for a missing "result" object in bulb responses; never mutated
+_EMPTY: Dict[str, Any] = {}
+
+# Seconds to wait for replies once every discovery probe has been sent
+DISCOVERY_TIMEOUT = 2.0
+
+# Valid range and error message for every numeric setPilot parameter
+_RANGES = (
+    ("dimming", 10, 100, "Brightness must be between 10 and 100"),
+    ("temp", 2200, 6500, "Color temperature must be between 2200K and 6500K"),
+    ("speed", 10, 200, "Speed must be between 10 and 200"),
+    ("r", 0, 255, "RGB values must be between 0 and 255"),
+    ("g", 0, 255, "RGB values must be between 0 and 255"),
+    ("b", 0, 255, "RGB values must be between 0 and 255"),
+)
+
+
+def _validate(params: Dict[str, Any]) -> None:
+    """
+    Check setPilot parameters against _RANGES in a single pass.
+    
+    Raises:
+        ValueError: If a parameter is outside its valid range
+    """
+    get = params.get
+    for key, low, high, message in _RANGES:
+        value = get(key)
+        if value is not None and not low <= value <= high:
+            raise ValueError(message)
+
+
+class PilotBuilder:
+    """
+    Collects setPilot parameters so several changes reach the bulb in one request.
+    
+    Methods return the builder, so calls chain:
+    
+        bulb.apply(PilotBuilder().state(True).rgb(255, 0, 0).dimming(80))
+    
+    Values are range-checked once, when the builder is applied.
+    
+    RGB color, white temperature and scenes are mutually exclusive bulb modes;
+    selecting one replaces any previously selected mode.
+    """
+    
+    # Builder methods that WizBulbController.set() accepts as keywords
+    METHODS = frozenset({"state", "dimming", "rgb", "temp", "scene", "speed"})
+    
+    def __init__(self):
+        self.params: Dict[str, Any] = {}
+    
+    def _select_mode(self, *keep: str) -> None:
+        """Drop parameters belonging to other color modes."""
+        for key in ("r", "g", "b", "temp", "sceneId"):
+            if key not in keep:
+                self.params.pop(key, None)
+    
+    def state(self, on: bool) -> "PilotBuilder":
+        """Turn the bulb on or off."""
+        self.params["state"] = on
+        return self
+    
+    def dimming(self, brightness: int) -> "PilotBuilder":
+        """Set brightness (10-100)."""
+        self.params["dimming"] = brightness
+        return self
+    
+    def rgb(self, r: int, g: int, b: int) -> "PilotBuilder":
+        """Set an RGB color (0-255 per channel)."""
+        self._select_mode("r", "g", "b")
+        self.params["r"] = r
+        self.params["g"] = g
+        self.params["b"] = b
+        return self
+    
+    def temp(self, temp: int) -> "PilotBuilder":
+        """Set a white color temperature in Kelvin (2200-6500)."""
+        self._select_mode("temp")
+        self.params["temp"] = temp
+        return self
+    
+    def scene(self, scene_id: int) -> "PilotBuilder":
+        """Select a predefined scene (see WizBulbController.set_scene)."""
+        self._select_mode("sceneId")
+        self.params["sceneId"] = scene_id
+        return self
+    
+    def speed(self, speed: int) -> "PilotBuilder":
+        """Set animation speed for dynamic scenes (10-200)."""
+        self.params["speed"] = speed
+        return self
+
 
 class WizBulbController:
     """Controller for Philips WiZ bulbs using UDP protocol on port 38899."""
     
+    # Payloads of commands that never change, serialized once at class load
+    _CMD_ON = _json_dumps({"method": "setPilot", "params": {"state": True}})
+    _CMD_OFF = _json_dumps({"method": "setPilot", "params": {"state": False}})
+    _CMD_STATUS = _json_dumps({"method": "getPilot"})
+    
+    # set_rgb_color always sends the same shape, so its payload is formatted
+    # straight into bytes instead of going through a dict and the encoder
+    _RGB_TMPL = b'{"method":"setPilot","params":{"state":true,"r":%d,"g":%d,"b":%d,"dimming":%d}}'
+    
+    # WiZ getPilot/setPilot replies are well under this size
+    RECV_BUFFER_SIZE = 512
+    
     def __init__(self, bulb_ip: str, port: int = 38899, timeout: float = 2.0):
         """
         Initialize the WiZ bulb controller.
@@ -26,6 +149,37 @@ class WizBulbController:
         self.port = port
         self.timeout = timeout
         self.socket = None
+        # Serializes request/response pairs on the shared socket so replies
+        # can't be picked up by another thread's command
+        self._lock = threading.Lock()
+        # Receive buffer reused for every reply (guarded by the same lock)
+        self._recv_buf = bytearray(self.RECV_BUFFER_SIZE)
+        self._recv_view = memoryview(self._recv_buf)
+    
+    def __enter__(self) -> "WizBulbController":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def _get_socket(self) -> socket.socket:
+        """Return the controller's UDP socket, creating it on first use."""
+        if self.socket is None:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            sock.settimeout(self.timeout)
+            self.socket = sock
+        return self.socket
+    
+    def _reset_socket(self) -> None:
+        """Drop the current socket so the next command starts with a fresh one."""
+        if self.socket is not None:
+            self.socket.close()
+            self.socket = None
+    
+    def close(self) -> None:
+        """Close the controller's UDP socket."""
+        with self._lock:
+            self._reset_socket()
     
     def _send_command(self, command: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
@@ -38,50 +192,91 @@ class WizBulbController:
             Response dictionary or None if failed
         """
         try:
-            # Create socket for each command to ensure clean state
-            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            sock.settimeout(self.timeout)
-            
-            # Send command
-            message = json.dumps(command).encode('utf-8')
-            sock.sendto(message, (self.bulb_ip, self.port))
-            
-            # Receive response
-            data, _ = sock.recvfrom(2048)
-            response = json.loads(data.decode('utf-8'))
-            
-            sock.close()
-            return response
-            
-        except socket.timeout:
-            print(f"Timeout: No response from bulb at {self.bulb_ip}")
-            return None
+            message = _json_dumps(command)
         except Exception as e:
-            print(f"Error communicating with bulb: {e}")
+            log.warning("Error communicating with bulb %s: %s", self.bulb_ip, e)
             return None
+        return self._send_raw(message)
+    
+    def _send_raw(self, message: bytes) -> Optional[Dict[str, Any]]:
+        """
+        Send an already serialized UDP command and return the parsed response.
+        
+        Args:
+            message: JSON command encoded as bytes
+            
+        Returns:
+            Response dictionary or None if failed
+        """
+        with self._lock:
+            try:
+                # Reuse one socket across commands instead of one per call
+                sock = self._get_socket()
+                
+                # Send command
+                sock.sendto(message, (self.bulb_ip, self.port))
+                
+                # Receive response straight into the reusable buffer
+                size, _ = sock.recvfrom_into(self._recv_buf)
+                return _json_loads(self._recv_view[:size])
+                
+            except socket.timeout:
+                # A late reply would otherwise be read as the next response
+                self._reset_socket()
+                log.debug("Timeout: no response from bulb at %s", self.bulb_ip)
+                return None
+            except OSError as e:
+                self._reset_socket()
+                log.warning("Error communicating with bulb %s: %s", self.bulb_ip, e)
+                return None
+            except Exception as e:
+                log.warning("Error communicating with bulb %s: %s", self.bulb_ip, e)
+                return None
+    
+    @staticmethod
+    def _ok(response: Optional[Dict[str, Any]]) -> bool:
+        """Tell whether a bulb response reports success."""
+        return response is not None and (response.get("result") or _EMPTY).get("success", False)
     
     def get_status(self) -> Optional[Dict[str, Any]]:
         """Get the current status of the bulb."""
-        command = {"method": "getPilot"}
-        return self._send_command(command)
+        return self._send_raw(self._CMD_STATUS)
     
     def turn_on(self) -> bool:
         """Turn the bulb on."""
-        command = {
-            "method": "setPilot",
-            "params": {"state": True}
-        }
-        response = self._send_command(command)
-        return response is not None and response.get("result", {}).get("success", False)
+        return self._ok(self._send_raw(self._CMD_ON))
     
     def turn_off(self) -> bool:
         """Turn the bulb off."""
-        command = {
-            "method": "setPilot",
-            "params": {"state": False}
-        }
-        response = self._send_command(command)
-        return response is not None and response.get("result", {}).get("success", False)
+        return self._ok(self._send_raw(self._CMD_OFF))
+    
+    def apply(self, builder: "PilotBuilder") -> bool:
+        """
+        Send every change collected in a PilotBuilder as one setPilot request.
+        
+        Args:
+            builder: The accumulated pilot changes
+            
+        Raises:
+            ValueError: If any collected value is out of range
+        """
+        _validate(builder.params)
+        return self.set_pilot(builder.params)
+    
+    def set(self, **kwargs: Any) -> bool:
+        """
+        Apply an ad-hoc batch of pilot changes in one request.
+        
+        Each keyword names a PilotBuilder method; tuple values are unpacked
+        into its arguments, e.g. bulb.set(state=True, rgb=(255, 0, 0), dimming=80).
+        """
+        builder = PilotBuilder()
+        for name, value in kwargs.items():
+            if name not in PilotBuilder.METHODS:
+                raise TypeError(f"Unknown pilot setting: {name}")
+            args = value if isinstance(value, tuple) else (value,)
+            getattr(builder, name)(*args)
+        return self.apply(builder)
     
     def set_brightness(self, brightness: int) -> bool:
         """
@@ -90,18 +285,7 @@ class WizBulbController:
         Args:
             brightness: Brightness level (10-100)
         """
-        if not 10 <= brightness <= 100:
-            raise ValueError("Brightness must be between 10 and 100")
-        
-        command = {
-            "method": "setPilot",
-            "params": {
-                "state": True,
-                "dimming": brightness
-            }
-        }
-        response = self._send_command(command)
-        return response is not None and response.get("result", {}).get("success", False)
+        return self.apply(PilotBuilder().state(True).dimming(brightness))
     
     def set_rgb_color(self, r: int, g: int, b: int, brightness: int = 100) -> bool:
         """
@@ -112,24 +296,22 @@ class WizBulbController:
             g: Green value (0-255)
             b: Blue value (0-255)
             brightness: Brightness level (10-100)
+            
+        Raises:
+            ValueError: If a color channel or the brightness is out of range
         """
-        if not all(0 <= val <= 255 for val in [r, g, b]):
-            raise ValueError("RGB values must be between 0 and 255")
-        if not 10 <= brightness <= 100:
-            raise ValueError("Brightness must be between 10 and 100")
+        if type(r) is int and type(g) is int and type(b) is int and type(brightness) is int:
+            # Same checks as _validate, without building a params dict.
+            # Any channel outside 0-255 (negatives included) has bits above the low byte
+            if (r | g | b) & ~0xFF:
+                raise ValueError("RGB values must be between 0 and 255")
+            if not 10 <= brightness <= 100:
+                raise ValueError("Brightness must be between 10 and 100")
+            return self._ok(self._send_raw(self._RGB_TMPL % (r, g, b, brightness)))
         
-        command = {
-            "method": "setPilot",
-            "params": {
-                "state": True,
-                "r": r,
-                "g": g,
-                "b": b,
-                "dimming": brightness
-            }
-        }
-        response = self._send_command(command)
-        return response is not None and response.get("result", {}).get("success", False)
+        # Anything else (e.g. floats) can't go through the %d template; the
+        # general path range-checks it and sends the values unchanged
+        return self.apply(PilotBuilder().state(True).rgb(r, g, b).dimming(brightness))
     
     def set_color_temperature(self, temp: int, brightness: int = 100) -> bool:
         """
@@ -139,21 +321,7 @@ class WizBulbController:
             temp: Color temperature in Kelvin (2200-6500)
             brightness: Brightness level (10-100)
         """
-        if not 2200 <= temp <= 6500:
-            raise ValueError("Color temperature must be between 2200K and 6500K")
-        if not 10 <= brightness <= 100:
-            raise ValueError("Brightness must be between 10 and 100")
-        
-        command = {
-            "method": "setPilot",
-            "params": {
-                "state": True,
-                "temp": temp,
-                "dimming": brightness
-            }
-        }
-        response = self._send_command(command)
-        return response is not None and response.get("result", {}).get("success", False)
+        return self.apply(PilotBuilder().state(True).temp(temp).dimming(brightness))
     
     def set_scene(self, scene_id: int) -> bool:
         """
@@ -168,15 +336,7 @@ class WizBulbController:
         25: Mojito, 26: Club, 27: Christmas, 28: Halloween, 29: Candlelight,
         30: Golden white, 31: Pulse, 32: Steampunk
         """
-        command = {
-            "method": "setPilot",
-            "params": {
-                "state": True,
-                "sceneId": scene_id
-            }
-        }
-        response = self._send_command(command)
-        return response is not None and response.get("result", {}).get("success", False)
+        return self.apply(PilotBuilder().state(True).scene(scene_id))
     
     def set_speed(self, speed: int) -> bool:
         """
@@ -185,70 +345,180 @@ class WizBulbController:
         Args:
             speed: Speed value (10-200, where 200 is fastest)
         """
-        if not 10 <= speed <= 200:
-            raise ValueError("Speed must be between 10 and 200")
-        
+        return self.apply(PilotBuilder().speed(speed))
+    
+    def set_pilot(self, params: Dict[str, Any]) -> bool:
+        """
+        Apply several pilot parameters in a single setPilot request.
+
+        Args:
+            params: setPilot parameters, e.g. {"state": True, "r": 255, "g": 0, "b": 0, "dimming": 50}
+        """
         command = {
             "method": "setPilot",
-            "params": {"speed": speed}
+            "params": params
         }
-        response = self._send_command(command)
-        return response is not None and response.get("result", {}).get("success", False)
-    
+        return self._ok(self._send_command(command))
+
+    @classmethod
+    def apply_many(cls, jobs: list, port: int = 38899,
+                   timeout: float = 1.5) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Send setPilot requests to many bulbs from a single UDP socket.
+
+        Every request is sent first, then replies are collected until the
+        timeout, so a scene change across a room costs one round-trip
+        instead of one per bulb.
+
+        Args:
+            jobs: (ip, params) pairs, where params are setPilot parameters
+                  such as PilotBuilder().params; a later job for the same IP
+                  replaces an earlier one
+            port: WiZ UDP port
+            timeout: Seconds to wait for replies after the last request is sent
+
+        Returns:
+            Response dictionary for every IP, or None for bulbs that didn't answer
+
+        Raises:
+            ValueError: If any job has an out-of-range value; nothing is sent
+        """
+        payloads = {}
+        for ip, params in jobs:
+            _validate(params)
+            payloads[ip] = _json_dumps({"method": "setPilot", "params": params})
+
+        return _fan_out(payloads, port, timeout)
+
     def is_online(self) -> bool:
         """Check if the bulb is online and responding."""
         status = self.get_status()
         return status is not None
 
 
+def _fan_out(payloads: Dict[str, bytes], port: int,
+             timeout: float) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    Send one UDP command per host from a single socket and collect the replies.
+    
+    Every command is sent first, then replies are read until all hosts have
+    answered or the timeout expires, so N hosts cost one round-trip.
+    
+    Args:
+        payloads: Serialized command for each IP address
+        port: WiZ UDP port
+        timeout: Seconds to wait for replies after the last command is sent
+        
+    Returns:
+        Parsed reply for every IP, or None for hosts that didn't answer
+    """
+    results: Dict[str, Optional[Dict[str, Any]]] = dict.fromkeys(payloads)
+    pending = set(payloads)
+    buf = bytearray(WizBulbController.RECV_BUFFER_SIZE)
+    view = memoryview(buf)
+    
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock, \
+            selectors.DefaultSelector() as sel:
+        sock.setblocking(False)
+        sel.register(sock, selectors.EVENT_WRITE)
+        
+        for ip, payload in payloads.items():
+            while True:
+                try:
+                    sock.sendto(payload, (ip, port))
+                    break
+                except BlockingIOError:
+                    # Send buffer is full; wait until it drains
+                    sel.select(timeout)
+                except OSError as e:
+                    # Unroutable or otherwise unusable address
+                    log.debug("Error communicating with bulb %s: %s", ip, e)
+                    pending.discard(ip)
+                    break
+        
+        # Every request is out; from here on only replies matter
+        sel.modify(sock, selectors.EVENT_READ)
+        deadline = time.monotonic() + timeout
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            
+            if not sel.select(remaining):
+                break
+            
+            try:
+                size, (addr, _) = sock.recvfrom_into(buf)
+            except OSError:
+                # e.g. an ICMP port-unreachable reported for an earlier request
+                continue
+            if addr not in pending:
+                continue
+            try:
+                results[addr] = _json_loads(view[:size])
+            except Exception as e:
+                log.debug("Unreadable reply from %s: %s", addr, e)
+                continue
+            pending.discard(addr)
+    
+    for ip in pending:
+        log.debug("Timeout: no response from bulb at %s", ip)
+    return results
+
+
+def _probe_hosts(ips: list, port: int = 38899, timeout: float = DISCOVERY_TIMEOUT) -> list:
+    """
+    Probe many hosts for WiZ bulbs from a single UDP socket.
+    
+    A getPilot request is sent to every address first, then replies are
+    collected until the timeout, so the whole scan costs one timeout rather
+    than one per host.
+    
+    Args:
+        ips: Candidate IP addresses
+        port: WiZ UDP port
+        timeout: Seconds to wait for replies after the last probe is sent
+        
+    Returns:
+        The candidate addresses that answered, in their original order
+    """
+    replies = _fan_out(dict.fromkeys(ips, WizBulbController._CMD_STATUS), port, timeout)
+    return [ip for ip, reply in replies.items() if reply is not None]
+
+
 def discover_bulbs(network_range: str = "192.168.1.0/24") -> list:
     """
-    Discover WiZ bulbs on the network using nmap.
+    Discover WiZ bulbs on the network by probing every host in a range.
     
     Args:
         network_range: Network range to scan (e.g., "192.168.1.0/24")
         
     Returns:
-        List of potential bulb IP addresses
+        List of bulb IP addresses that answered
     """
-    import subprocess
-    import re
-    
     try:
-        # Run nmap to discover devices
-        result = subprocess.run(
-            ["nmap", "-sn", network_range],
-            capture_output=True,
-            text=True,
-            timeout=120
-        )
-        
-        # Extract IP addresses from nmap output
-        ips = re.findall(r'\b(?:[0-9]{1,3}\.){3}[0-9]{1,3}\b', result.stdout)
+        # Every usable host address in the range is a candidate; WiZ bulbs
+        # answer the UDP probe directly, so no separate ping scan is needed
+        ips = [str(ip) for ip in ipaddress.ip_network(network_range, strict=False).hosts()]
         
-        # Test each IP to see if it's a WiZ bulb
-        bulb_ips = []
-        for ip in ips:
-            controller = WizBulbController(ip, timeout=1.0)
-            if controller.is_online():
-                bulb_ips.append(ip)
-                print(f"Found WiZ bulb at: {ip}")
+        # Probe every IP at once to see which ones are WiZ bulbs
+        bulb_ips = _probe_hosts(ips)
+        for ip in bulb_ips:
+            log.info("Found WiZ bulb at: %s", ip)
         
         return bulb_ips
         
-    except subprocess.TimeoutExpired:
-        print("Network scan timed out")
-        return []
-    except FileNotFoundError:
-        print("nmap not found. Please install nmap to use bulb discovery.")
+    except ValueError as e:
+        log.error("Invalid network range %r: %s", network_range, e)
         return []
     except Exception as e:
-        print(f"Error during discovery: {e}")
+        log.error("Error during discovery: %s", e)
         return []
 
 
 def main():
     """Example usage of the WiZ bulb controller."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     
     # Discover WiZ bulbs on the network
     print("🔍 Discovering WiZ bulbs on the network...")
@@ -259,7 +529,6 @@ def main():
         print("Make sure:")
         print("  1. Your bulbs are powered on and connected to WiFi")
         print("  2. You're on the same network as the bulbs")
-        print("  3. nmap is installed (brew install nmap on macOS)")
         print("\nYou can also manually specify an IP address by editing BULB_IP variable.")
         return
     
@@ -272,63 +541,54 @@ def main():
         print(f"   All discovered bulbs: {', '.join(bulb_ips)}")
     
     print(f"\n🔮 Connecting to WiZ bulb at {BULB_IP}...")
-    bulb = WizBulbController(BULB_IP)
-    
-    # Check if bulb is online
-    if not bulb.is_online():
-        print("Bulb is not responding. Check IP address and network connection.")
-        return
-    
-    print("Bulb is online!")
-    
-    # Get current status
-    status = bulb.get_status()
-    if status:
-        print(f"Current status: {json.dumps(status, indent=2)}")
-    
-    # Demo sequence
-    print("\n--- Demo Sequence ---")
-    
-    # Turn on
-    print("Turning bulb on...")
-    bulb.turn_on()
-    time.sleep(1)
-    
-    # Set to bright white
-    print("Setting to bright white...")
-    bulb.set_color_temperature(4000, 100)
-    time.sleep(2)
-    
-    # Set to red
-    print("Setting to red...")
-    bulb.set_rgb_color(255, 0, 0, 80)
-    time.sleep(2)
-    
-    # Set to blue
-    print("Setting to blue...")
-    bulb.set_rgb_color(0, 0, 255, 80)
-    time.sleep(2)
-    
-    # Set to green
-    print("Setting to green...")
-    bulb.set_rgb_color(0, 255, 0, 80)
-    time.sleep(2)
-    
-    # Set romantic scene
-    print("Setting romantic scene...")
-    bulb.set_scene(2)  # Romance scene
-    time.sleep(3)
-    
-    # Dim to 30%
-    print("Dimming to 30%...")
-    bulb.set_brightness(30)
-    time.sleep(2)
-    
-    # Turn off
-    print("Turning bulb off...")
-    bulb.turn_off()
-    
-    print("Demo complete!")
+    with WizBulbController(BULB_IP) as bulb:
+        # Check if bulb is online
+        if not bulb.is_online():
+            print("Bulb is not responding. Check IP address and network connection.")
+            return
+        
+        print("Bulb is online!")
+        
+        # Get current status
+        status = bulb.get_status()
+        if status:
+            print(f"Current status: {json.dumps(status, indent=2)}")
+        
+        # Demo sequence
+        print("\n--- Demo Sequence ---")
+        
+        # Each step is a single setPilot request built with PilotBuilder
+        
+        # Turn on in bright white
+        print("Turning bulb on in bright white...")
+        bulb.apply(PilotBuilder().state(True).temp(4000).dimming(100))
+        time.sleep(2)
+        
+        # Set to red
+        print("Setting to red...")
+        bulb.apply(PilotBuilder().state(True).rgb(255, 0, 0).dimming(80))
+        time.sleep(2)
+        
+        # Set to blue
+        print("Setting to blue...")
+        bulb.apply(PilotBuilder().state(True).rgb(0, 0, 255).dimming(80))
+        time.sleep(2)
+        
+        # Set to green
+        print("Setting to green...")
+        bulb.apply(PilotBuilder().state(True).rgb(0, 255, 0).dimming(80))
+        time.sleep(2)
+        
+        # Set romantic scene dimmed to 30%
+        print("Setting romantic scene at 30%...")
+        bulb.apply(PilotBuilder().state(True).scene(2).dimming(30))  # Romance scene
+        time.sleep(3)
+        
+        # Turn off
+        print("Turning bulb off...")
+        bulb.apply(PilotBuilder().state(False))
+        
+        print("Demo complete!")
 
 
 if __name__ == "__main__":
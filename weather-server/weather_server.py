@@ -5,16 +5,49 @@ This server provides weather information for cities using the WeatherAPI service
 It demonstrates how to create a basic MCP server with a single tool.
 """
 
+import asyncio
+import atexit
+import json
 import os
-import requests
+
+import httpx
+from cachetools import TTLCache
 from mcp.server.fastmcp import FastMCP
 
+# Parse responses with orjson when available; it reads the raw bytes directly
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 # Create the MCP server
 mcp = FastMCP("Weather Server")
 
 # WeatherAPI configuration
 WEATHER_API_KEY = os.getenv("WEATHER_API_KEY")
-WEATHER_API_BASE_URL = "http://api.weatherapi.com/v1/current.json"
+WEATHER_API_BASE_URL = "https://api.weatherapi.com/v1/current.json"
+
+# Shared async client: connections are pooled (and multiplexed over HTTP/2)
+# across calls, and requests don't block the event loop, so concurrent tool
+# calls overlap their network waits
+_client = httpx.AsyncClient(http2=True, timeout=10)
+
+
+def _close_client() -> None:
+    """Close the shared HTTP client when the interpreter exits."""
+    try:
+        asyncio.run(_client.aclose())
+    except RuntimeError:
+        # Connections tied to the server's already closed event loop
+        pass
+
+
+atexit.register(_close_client)
+
+# Current conditions change on a minute scale, so successful lookups are
+# reused for a short while instead of calling the API again
+WEATHER_CACHE_TTL = 60
+_weather_cache = TTLCache(maxsize=512, ttl=WEATHER_CACHE_TTL)
 
 # Validate API key is available
 if not WEATHER_API_KEY or WEATHER_API_KEY == "your_weather_api_key_here":
@@ -23,17 +56,59 @@ if not WEATHER_API_KEY or WEATHER_API_KEY == "your_weather_api_key_here":
     print("   See .env.example for reference")
 
 
+def _fmt(result: dict) -> dict[str, str]:
+    """Render a weather result in the older preformatted string form."""
+    return {
+        "city": f"{result['city_name']}, {result['country']}",
+        "temperature": f"{result['temp_c']}°C",
+        "condition": result["condition"],
+        "wind_speed": f"{result['wind_kph']} km/h"
+    }
+
+
+def _error(city: str, message: str, stringify: bool) -> dict[str, str | None]:
+    """Build a failed lookup's result in the shape the caller asked for."""
+    if stringify:
+        return {
+            "error": message,
+            "city": city,
+            "temperature": "N/A",
+            "condition": "N/A",
+            "wind_speed": "N/A"
+        }
+    return {
+        "error": message,
+        "city_name": city,
+        "country": None,
+        "temp_c": None,
+        "condition": None,
+        "wind_kph": None
+    }
+
+
 @mcp.tool()
-def get_weather(city: str) -> dict[str, str]:
+async def get_weather(city: str, stringify: bool = False) -> dict[str, str | float | None]:
     """
     Get current weather information for a city.
     
+    Values are returned as native types: "temp_c" (float, degrees Celsius)
+    and "wind_kph" (float, km/h) are numbers, and "city_name", "country" and
+    "condition" are strings. On failure an "error" message is included and
+    the weather fields are None ("N/A" when stringify is set).
+    
     Args:
         city: The name of the city to get weather for
+        stringify: Return the older preformatted strings instead
+                   ("city", "temperature", "condition", "wind_speed")
         
     Returns:
         Dictionary containing temperature, condition, and wind speed
     """
+    cache_key = city.strip().lower()
+    cached = _weather_cache.get(cache_key)
+    if cached is not None:
+        return _fmt(cached) if stringify else cached
+    
     try:
         # Make API request to WeatherAPI
         params = {
@@ -42,46 +117,34 @@ def get_weather(city: str) -> dict[str, str]:
             "aqi": "no"  # We don't need air quality data
         }
         
-        response = requests.get(WEATHER_API_BASE_URL, params=params, timeout=10)
+        response = await _client.get(WEATHER_API_BASE_URL, params=params)
         response.raise_for_status()  # Raise an exception for bad status codes
         
-        data = response.json()
+        data = _json_loads(response.content)
         
         # Extract the relevant weather information
         current = data["current"]
         location = data["location"]
         
-        return {
-            "city": f"{location['name']}, {location['country']}",
-            "temperature": f"{current['temp_c']}°C",
+        result = {
+            "city_name": location["name"],
+            "country": location["country"],
+            "temp_c": current["temp_c"],
             "condition": current["condition"]["text"],
-            "wind_speed": f"{current['wind_kph']} km/h"
+            "wind_kph": current["wind_kph"]
         }
         
-    except requests.exceptions.RequestException as e:
-        return {
-            "error": f"Failed to fetch weather data: {str(e)}",
-            "city": city,
-            "temperature": "N/A",
-            "condition": "N/A",
-            "wind_speed": "N/A"
-        }
+        # Only successful lookups are cached; errors are retried next time
+        _weather_cache[cache_key] = result
+        
+        return _fmt(result) if stringify else result
+        
+    except httpx.HTTPError as e:
+        return _error(city, f"Failed to fetch weather data: {str(e)}", stringify)
     except KeyError as e:
-        return {
-            "error": f"Unexpected response format: missing {str(e)}",
-            "city": city,
-            "temperature": "N/A",
-            "condition": "N/A",
-            "wind_speed": "N/A"
-        }
+        return _error(city, f"Unexpected response format: missing {str(e)}", stringify)
     except Exception as e:
-        return {
-            "error": f"An unexpected error occurred: {str(e)}",
-            "city": city,
-            "temperature": "N/A",
-            "condition": "N/A",
-            "wind_speed": "N/A"
-        }
+        return _error(city, f"An unexpected error occurred: {str(e)}", stringify)
 
 
 def main():